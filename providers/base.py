@@ -2,9 +2,12 @@
 
 import base64
 import binascii
+import functools
 import logging
 import os
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
@@ -112,9 +115,14 @@ class DiscreteTemperatureConstraint(TemperatureConstraint):
         return self.default_temp
 
 
+@functools.cache
 def create_temperature_constraint(constraint_type: str) -> TemperatureConstraint:
     """Create temperature constraint object from configuration string.
 
+    Constraints are immutable once built, so the factory is memoized: models
+    with the same constraint type (within and across provider tables) share a
+    single instance instead of constructing one per SUPPORTED_MODELS entry.
+
     Args:
         constraint_type: Type of constraint ("fixed", "range", "discrete")
 
@@ -167,6 +175,14 @@ class ModelCapabilities:
         default_factory=lambda: RangeTemperatureConstraint(0.0, 2.0, 0.3)
     )
 
+    def __post_init__(self):
+        # Intern the identity strings so equality checks on lookup paths can
+        # degrade to pointer comparisons and duplicated literals (the same
+        # model referenced across providers and tests) share storage
+        self.model_name = sys.intern(self.model_name)
+        self.friendly_name = sys.intern(self.friendly_name)
+        self.description = sys.intern(self.description)
+
 
 @dataclass
 class ModelResponse:
@@ -341,6 +357,13 @@ class ModelProvider(ABC):
         Returns:
             Resolved model name
         """
+        # Fast path: the dominant input is an already-canonical model name, so
+        # probe SUPPORTED_MODELS directly before building the configuration
+        # dict and scanning aliases
+        supported = getattr(self, "SUPPORTED_MODELS", None)
+        if supported and model_name in supported:
+            return model_name
+
         # Get model configurations from the hook method
         model_configs = self.get_model_configurations()
 
@@ -508,12 +531,14 @@ class ModelProvider(ABC):
         # Base implementation: no resources to clean up
         return
 
-    def get_preferred_model(self, category: "ToolModelCategory", allowed_models: list[str]) -> Optional[str]:
+    def get_preferred_model(self, category: "ToolModelCategory", allowed_models: Collection[str]) -> Optional[str]:
         """Get the preferred model from this provider for a given category.
 
         Args:
             category: The tool category requiring a model
-            allowed_models: Pre-filtered list of model names that are allowed by restrictions
+            allowed_models: Pre-filtered collection of model names that are allowed by
+                restrictions. Implementations should probe membership via a set so the
+                check is O(1) regardless of what the caller passes.
 
         Returns:
             Model name if this provider has a preference, None otherwise
@@ -278,7 +278,9 @@ class DIALModelProvider(OpenAICompatibleProvider):
         """
         resolved_name = self._resolve_model_name(model_name)
 
-        if resolved_name not in self.SUPPORTED_MODELS:
+        # Single dict probe instead of membership test plus lookup
+        capabilities = self.SUPPORTED_MODELS.get(resolved_name)
+        if capabilities is None:
             raise ValueError(f"Unsupported DIAL model: {model_name}")
 
         # Check restrictions
@@ -288,8 +290,7 @@ class DIALModelProvider(OpenAICompatibleProvider):
         if not restriction_service.is_allowed(ProviderType.DIAL, resolved_name, model_name):
             raise ValueError(f"Model '{model_name}' is not allowed by restriction policy.")
 
-        # Return the ModelCapabilities object directly from SUPPORTED_MODELS
-        return self.SUPPORTED_MODELS[resolved_name]
+        return capabilities
 
     def get_provider_type(self) -> ProviderType:
         """Get the provider type."""
@@ -522,8 +523,9 @@ class DIALModelProvider(OpenAICompatibleProvider):
         """
         resolved_name = self._resolve_model_name(model_name)
 
-        if resolved_name in self.SUPPORTED_MODELS:
-            return self.SUPPORTED_MODELS[resolved_name].supports_images
+        capabilities = self.SUPPORTED_MODELS.get(resolved_name)
+        if capabilities is not None:
+            return capabilities.supports_images
 
         # Fall back to parent implementation for unknown models
         return super()._supports_vision(model_name)
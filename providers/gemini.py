@@ -3,6 +3,7 @@
 import base64
 import logging
 import time
+from collections.abc import Collection
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
@@ -134,7 +135,9 @@ class GeminiModelProvider(ModelProvider):
         # Resolve shorthand
         resolved_name = self._resolve_model_name(model_name)
 
-        if resolved_name not in self.SUPPORTED_MODELS:
+        # Single dict probe instead of membership test plus lookup
+        capabilities = self.SUPPORTED_MODELS.get(resolved_name)
+        if capabilities is None:
             raise ValueError(f"Unsupported Gemini model: {model_name}")
 
         # Check if model is allowed by restrictions
@@ -146,8 +149,7 @@ class GeminiModelProvider(ModelProvider):
         if not restriction_service.is_allowed(ProviderType.GOOGLE, resolved_name, model_name):
             raise ValueError(f"Gemini model '{resolved_name}' is not allowed by restriction policy.")
 
-        # Return the ModelCapabilities object directly from SUPPORTED_MODELS
-        return self.SUPPORTED_MODELS[resolved_name]
+        return capabilities
 
     def generate_content(
         self,
@@ -462,24 +464,25 @@ class GeminiModelProvider(ModelProvider):
             logger.error(f"Error processing image {image_path}: {e}")
             return None
 
-    def get_preferred_model(self, category: "ToolModelCategory", allowed_models: list[str]) -> Optional[str]:
+    def get_preferred_model(self, category: "ToolModelCategory", allowed_models: Collection[str]) -> Optional[str]:
         """Get Gemini's preferred model for a given category from allowed models.
 
         Args:
             category: The tool category requiring a model
-            allowed_models: Pre-filtered list of models allowed by restrictions
+            allowed_models: Pre-filtered collection of models allowed by restrictions
 
         Returns:
             Preferred model name or None
         """
-        from tools.models import ToolModelCategory
-
         if not allowed_models:
             return None
 
+        # O(1) membership probes even when the caller passes a list
+        allowed_set = allowed_models if isinstance(allowed_models, (set, frozenset)) else frozenset(allowed_models)
+
         # Always return gemini-2.5-pro if it's in the allowed models
-        if "gemini-2.5-pro" in allowed_models:
+        if "gemini-2.5-pro" in allowed_set:
             return "gemini-2.5-pro"
-        
-        # Fallback to first allowed model if gemini-2.5-pro is not available
-        return allowed_models[0] if allowed_models else None
+
+        # Fallback to first allowed model (in caller order) if it is not available
+        return next(iter(allowed_models))
@@ -45,8 +45,11 @@ class OpenAICompatibleProvider(ModelProvider):
         self.organization = kwargs.get("organization")
         self.allowed_models = self._parse_allowed_models()
 
-        # Configure timeouts - especially important for custom/local endpoints
-        self.timeout_config = self._configure_timeouts(**kwargs)
+        # Timeout configuration is computed lazily on first client access so
+        # lookup-only usage (model validation, capability queries) never pays
+        # for it; keep the constructor kwargs around for that computation.
+        self._timeout_config = None
+        self._timeout_kwargs = kwargs
 
         # Validate base URL for security
         if self.base_url:
@@ -193,6 +196,18 @@ class OpenAICompatibleProvider(ModelProvider):
                 raise
             raise ValueError(f"Invalid base URL '{self.base_url}': {str(e)}")
 
+    @property
+    def timeout_config(self):
+        """Lazily built httpx timeout configuration.
+
+        Configure timeouts on first access - especially important for
+        custom/local endpoints, and deferred so that provider construction
+        stays cheap for callers that never issue a request.
+        """
+        if self._timeout_config is None:
+            self._timeout_config = self._configure_timeouts(**self._timeout_kwargs)
+        return self._timeout_config
+
     @property
     def client(self):
         """Lazy initialization of OpenAI client with security checks and timeout configuration."""
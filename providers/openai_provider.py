@@ -1,11 +1,25 @@
 """OpenAI model provider implementation."""
 
+import functools
 import logging
+from collections.abc import Collection
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from tools.models import ToolModelCategory
 
+try:
+    from utils.model_restrictions import get_restriction_service
+except ImportError:
+    # Circular import when utils.model_restrictions itself triggers loading of
+    # the providers package; fall back to a lazy import on first use.
+    def get_restriction_service():
+        from utils.model_restrictions import get_restriction_service as _get_restriction_service
+
+        return _get_restriction_service()
+
+
 from .base import (
     ModelCapabilities,
     ModelResponse,
@@ -16,48 +30,67 @@ from .openai_compatible import OpenAICompatibleProvider
 
 logger = logging.getLogger(__name__)
 
+# Models that support reasoning tokens (extended thinking)
+_THINKING_MODELS: frozenset[str] = frozenset({"gpt-5-latest"})
+
+# Model preference order for get_preferred_model, best-first
+_PREFERRED_ORDER: tuple[str, ...] = ("gpt-5-latest",)
+
 
 class OpenAIModelProvider(OpenAICompatibleProvider):
     """Official OpenAI API provider (api.openai.com)."""
 
-    # Model configurations using ModelCapabilities objects
-    SUPPORTED_MODELS = {
-        "gpt-5-latest": ModelCapabilities(
-            provider=ProviderType.OPENAI,
-            model_name="gpt-5-latest",
-            friendly_name="OpenAI (GPT-5 Latest)",
-            context_window=400_000,  # 400K tokens
-            max_output_tokens=128_000,  # 128K max output tokens
-            supports_extended_thinking=True,  # Supports reasoning tokens
-            supports_system_prompts=True,
-            supports_streaming=True,
-            supports_function_calling=True,
-            supports_json_mode=True,
-            supports_images=True,  # GPT-5 supports vision
-            max_image_size_mb=20.0,  # 20MB per OpenAI docs
-            supports_temperature=True,  # Regular models accept temperature parameter
-            temperature_constraint=create_temperature_constraint("fixed"),
-            description="GPT-5 Latest (400K context, 128K output) - Most advanced GPT-5 model with reasoning support",
-            aliases=["gpt5-latest", "gpt-5-latest", "gpt5", "gpt-5", "openai", "gpt"],
-        ),
-        "gpt-4.1": ModelCapabilities(
-            provider=ProviderType.OPENAI,
-            model_name="gpt-4.1",
-            friendly_name="OpenAI (GPT 4.1)",
-            context_window=1_000_000,  # 1M tokens
-            max_output_tokens=32_768,
-            supports_extended_thinking=False,
-            supports_system_prompts=True,
-            supports_streaming=True,
-            supports_function_calling=True,
-            supports_json_mode=True,
-            supports_images=True,  # GPT-4.1 supports vision
-            max_image_size_mb=20.0,  # 20MB per OpenAI docs
-            supports_temperature=True,  # Regular models accept temperature parameter
-            temperature_constraint=create_temperature_constraint("range"),
-            description="GPT-4.1 (1M context) - Advanced reasoning model with large context window",
-            aliases=["gpt4.1", "gpt-4.1"],
-        ),
+    # Model configurations using ModelCapabilities objects. The mapping is
+    # read-only after construction, so it is frozen behind a MappingProxyType
+    # to guarantee the precomputed indexes below never go stale.
+    SUPPORTED_MODELS = MappingProxyType(
+        {
+            "gpt-5-latest": ModelCapabilities(
+                provider=ProviderType.OPENAI,
+                model_name="gpt-5-latest",
+                friendly_name="OpenAI (GPT-5 Latest)",
+                context_window=400_000,  # 400K tokens
+                max_output_tokens=128_000,  # 128K max output tokens
+                supports_extended_thinking=True,  # Supports reasoning tokens
+                supports_system_prompts=True,
+                supports_streaming=True,
+                supports_function_calling=True,
+                supports_json_mode=True,
+                supports_images=True,  # GPT-5 supports vision
+                max_image_size_mb=20.0,  # 20MB per OpenAI docs
+                supports_temperature=True,  # Regular models accept temperature parameter
+                temperature_constraint=create_temperature_constraint("fixed"),
+                description="GPT-5 Latest (400K context, 128K output) - Most advanced GPT-5 model with reasoning support",
+                aliases=["gpt5-latest", "gpt-5-latest", "gpt5", "gpt-5", "openai", "gpt"],
+            ),
+            "gpt-4.1": ModelCapabilities(
+                provider=ProviderType.OPENAI,
+                model_name="gpt-4.1",
+                friendly_name="OpenAI (GPT 4.1)",
+                context_window=1_000_000,  # 1M tokens
+                max_output_tokens=32_768,
+                supports_extended_thinking=False,
+                supports_system_prompts=True,
+                supports_streaming=True,
+                supports_function_calling=True,
+                supports_json_mode=True,
+                supports_images=True,  # GPT-4.1 supports vision
+                max_image_size_mb=20.0,  # 20MB per OpenAI docs
+                supports_temperature=True,  # Regular models accept temperature parameter
+                temperature_constraint=create_temperature_constraint("range"),
+                description="GPT-4.1 (1M context) - Advanced reasoning model with large context window",
+                aliases=["gpt4.1", "gpt-4.1"],
+            ),
+        }
+    )
+
+    # Reverse index mapping every alias, canonical key, and API model name
+    # (lowercased) to its SUPPORTED_MODELS key. Built once at class definition
+    # so lookups are a single hash probe instead of a scan over all models.
+    _ALIAS_INDEX = {
+        alias.lower(): key
+        for key, capabilities in SUPPORTED_MODELS.items()
+        for alias in (key, capabilities.model_name, *capabilities.aliases)
     }
 
     def __init__(self, api_key: str, **kwargs):
@@ -65,44 +98,34 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
         # Set default OpenAI base URL, allow override for regions/custom endpoints
         kwargs.setdefault("base_url", "https://api.openai.com/v1")
         super().__init__(api_key, **kwargs)
+        # Per-instance memo of capabilities that passed the restriction check;
+        # SUPPORTED_MODELS and restrictions are immutable for our lifetime
+        self._capabilities_cache: dict[str, ModelCapabilities] = {}
+
+    @functools.cached_property
+    def _restrictions(self):
+        """Cached handle to the restriction service singleton."""
+        return get_restriction_service()
 
     def get_capabilities(self, model_name: str) -> ModelCapabilities:
         """Get capabilities for a specific OpenAI model."""
-        # First check if it's a key in SUPPORTED_MODELS
-        if model_name in self.SUPPORTED_MODELS:
-            # Check if model is allowed by restrictions
-            from utils.model_restrictions import get_restriction_service
-
-            restriction_service = get_restriction_service()
-            if not restriction_service.is_allowed(ProviderType.OPENAI, model_name, model_name):
-                raise ValueError(f"OpenAI model '{model_name}' is not allowed by restriction policy.")
-            return self.SUPPORTED_MODELS[model_name]
-
-        # Try resolving as alias
-        resolved_name = self._resolve_model_name(model_name)
-
-        # Check if resolved name is a key
-        if resolved_name in self.SUPPORTED_MODELS:
-            # Check if model is allowed by restrictions
-            from utils.model_restrictions import get_restriction_service
-
-            restriction_service = get_restriction_service()
-            if not restriction_service.is_allowed(ProviderType.OPENAI, resolved_name, model_name):
-                raise ValueError(f"OpenAI model '{model_name}' is not allowed by restriction policy.")
-            return self.SUPPORTED_MODELS[resolved_name]
-
-        # Finally check if resolved name matches any API model name
-        for key, capabilities in self.SUPPORTED_MODELS.items():
-            if resolved_name == capabilities.model_name:
-                # Check if model is allowed by restrictions
-                from utils.model_restrictions import get_restriction_service
-
-                restriction_service = get_restriction_service()
-                if not restriction_service.is_allowed(ProviderType.OPENAI, key, model_name):
-                    raise ValueError(f"OpenAI model '{model_name}' is not allowed by restriction policy.")
-                return capabilities
-
-        raise ValueError(f"Unsupported OpenAI model: {model_name}")
+        # Memoized: repeated lookups for the same name are a single dict probe
+        capabilities = self._capabilities_cache.get(model_name)
+        if capabilities is not None:
+            return capabilities
+
+        # One hash probe covers canonical keys, aliases, and API model names
+        resolved_name = self._ALIAS_INDEX.get(model_name.lower())
+        if resolved_name is None:
+            raise ValueError(f"Unsupported OpenAI model: {model_name}")
+
+        # Check if model is allowed by restrictions
+        if not self._restrictions.is_allowed(ProviderType.OPENAI, resolved_name, model_name):
+            raise ValueError(f"OpenAI model '{model_name}' is not allowed by restriction policy.")
+
+        capabilities = self.SUPPORTED_MODELS[resolved_name]
+        self._capabilities_cache[model_name] = capabilities
+        return capabilities
 
     def get_provider_type(self) -> ProviderType:
         """Get the provider type."""
@@ -110,22 +133,22 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
 
     def validate_model_name(self, model_name: str) -> bool:
         """Validate if the model name is supported and allowed."""
-        resolved_name = self._resolve_model_name(model_name)
-
-        # First check if model is supported
-        if resolved_name not in self.SUPPORTED_MODELS:
+        # First check if model is supported via the precomputed index
+        resolved_name = self._ALIAS_INDEX.get(model_name.lower())
+        if resolved_name is None:
             return False
 
         # Then check if model is allowed by restrictions
-        from utils.model_restrictions import get_restriction_service
-
-        restriction_service = get_restriction_service()
-        if not restriction_service.is_allowed(ProviderType.OPENAI, resolved_name, model_name):
+        if not self._restrictions.is_allowed(ProviderType.OPENAI, resolved_name, model_name):
             logger.debug(f"OpenAI model '{model_name}' -> '{resolved_name}' blocked by restrictions")
             return False
 
         return True
 
+    def _resolve_model_name(self, model_name: str) -> str:
+        """Resolve model shorthand to full name via the memoized alias index."""
+        return _resolve_openai_alias(model_name)
+
     def generate_content(
         self,
         prompt: str,
@@ -152,29 +175,38 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
     def supports_thinking_mode(self, model_name: str) -> bool:
         """Check if the model supports extended thinking mode."""
         # GPT-5 models support reasoning tokens (extended thinking)
-        resolved_name = self._resolve_model_name(model_name)
-        if resolved_name in ["gpt-5-latest"]:
-            return True
-        return False
+        return self._resolve_model_name(model_name) in _THINKING_MODELS
 
-    def get_preferred_model(self, category: "ToolModelCategory", allowed_models: list[str]) -> Optional[str]:
+    def get_preferred_model(self, category: "ToolModelCategory", allowed_models: Collection[str]) -> Optional[str]:
         """Get OpenAI's preferred model for a given category from allowed models.
 
         Args:
             category: The tool category requiring a model
-            allowed_models: Pre-filtered list of models allowed by restrictions
+            allowed_models: Pre-filtered collection of models allowed by restrictions
 
         Returns:
             Preferred model name or None
         """
-        from tools.models import ToolModelCategory
-
         if not allowed_models:
             return None
 
-        # Always return gpt-5-latest if it's in the allowed models
-        if "gpt-5-latest" in allowed_models:
-            return "gpt-5-latest"
-        
-        # Fallback to first allowed model if gpt-5-latest is not available
-        return allowed_models[0] if allowed_models else None
+        # O(1) membership probes even when the caller passes a list
+        allowed_set = allowed_models if isinstance(allowed_models, (set, frozenset)) else frozenset(allowed_models)
+
+        # Return the first model from the preference order that is allowed
+        for preferred in _PREFERRED_ORDER:
+            if preferred in allowed_set:
+                return preferred
+
+        # Fallback to first allowed model (in caller order) if none preferred
+        return next(iter(allowed_models))
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_openai_alias(model_name: str) -> str:
+    """Memoized alias resolution shared across provider instances.
+
+    The alias index is frozen at class definition time, so resolution is a
+    pure function of the model name and safe to cache at module level.
+    """
+    return OpenAIModelProvider._ALIAS_INDEX.get(model_name.lower(), model_name)
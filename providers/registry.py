@@ -272,9 +272,12 @@ class ModelProviderRegistry:
             except AttributeError:
                 supported_models = []
 
-        # Filter by restrictions
+        # Filter by restrictions in one batch pass over the service
+        allowed_map = restriction_service.is_allowed_batch(
+            (provider_type, model_name, None) for model_name in supported_models
+        )
         for model_name in supported_models:
-            if restriction_service.is_allowed(provider_type, model_name):
+            if allowed_map[(provider_type, model_name)]:
                 allowed_models.append(model_name)
 
         return allowed_models
@@ -1,6 +1,8 @@
 """X.AI (GROK) model provider implementation."""
 
+import functools
 import logging
+from collections.abc import Collection
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
@@ -80,6 +82,15 @@ class XAIModelProvider(OpenAICompatibleProvider):
         ),
     }
 
+    # Reverse index mapping every alias, canonical key, and API model name
+    # (lowercased) to its SUPPORTED_MODELS key, so case-insensitive resolution
+    # is one .lower() plus one hash probe instead of a per-alias scan.
+    _ALIAS_INDEX = {
+        alias.lower(): key
+        for key, capabilities in SUPPORTED_MODELS.items()
+        for alias in (key, capabilities.model_name, *capabilities.aliases)
+    }
+
     def __init__(self, api_key: str, **kwargs):
         """Initialize X.AI provider with API key."""
         # Set X.AI base URL
@@ -91,7 +102,9 @@ class XAIModelProvider(OpenAICompatibleProvider):
         # Resolve shorthand
         resolved_name = self._resolve_model_name(model_name)
 
-        if resolved_name not in self.SUPPORTED_MODELS:
+        # Single dict probe instead of membership test plus lookup
+        capabilities = self.SUPPORTED_MODELS.get(resolved_name)
+        if capabilities is None:
             raise ValueError(f"Unsupported X.AI model: {model_name}")
 
         # Check if model is allowed by restrictions
@@ -101,8 +114,7 @@ class XAIModelProvider(OpenAICompatibleProvider):
         if not restriction_service.is_allowed(ProviderType.XAI, resolved_name, model_name):
             raise ValueError(f"X.AI model '{model_name}' is not allowed by restriction policy.")
 
-        # Return the ModelCapabilities object directly from SUPPORTED_MODELS
-        return self.SUPPORTED_MODELS[resolved_name]
+        return capabilities
 
     def get_provider_type(self) -> ProviderType:
         """Get the provider type."""
@@ -126,6 +138,10 @@ class XAIModelProvider(OpenAICompatibleProvider):
 
         return True
 
+    def _resolve_model_name(self, model_name: str) -> str:
+        """Resolve model shorthand to full name via the memoized alias index."""
+        return _resolve_xai_alias(model_name)
+
     def generate_content(
         self,
         prompt: str,
@@ -157,24 +173,35 @@ class XAIModelProvider(OpenAICompatibleProvider):
             return capabilities.supports_extended_thinking
         return False
 
-    def get_preferred_model(self, category: "ToolModelCategory", allowed_models: list[str]) -> Optional[str]:
+    def get_preferred_model(self, category: "ToolModelCategory", allowed_models: Collection[str]) -> Optional[str]:
         """Get XAI's preferred model for a given category from allowed models.
 
         Args:
             category: The tool category requiring a model
-            allowed_models: Pre-filtered list of models allowed by restrictions
+            allowed_models: Pre-filtered collection of models allowed by restrictions
 
         Returns:
             Preferred model name or None
         """
-        from tools.models import ToolModelCategory
-
         if not allowed_models:
             return None
 
+        # O(1) membership probes even when the caller passes a list
+        allowed_set = allowed_models if isinstance(allowed_models, (set, frozenset)) else frozenset(allowed_models)
+
         # Always return grok-4 if it's in the allowed models
-        if "grok-4" in allowed_models:
+        if "grok-4" in allowed_set:
             return "grok-4"
-        
-        # Fallback to first allowed model if grok-4 is not available
-        return allowed_models[0] if allowed_models else None
+
+        # Fallback to first allowed model (in caller order) if grok-4 is not available
+        return next(iter(allowed_models))
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_xai_alias(model_name: str) -> str:
+    """Memoized alias resolution shared across provider instances.
+
+    The alias index is frozen at class definition time, so resolution is a
+    pure function of the model name and safe to cache at module level.
+    """
+    return XAIModelProvider._ALIAS_INDEX.get(model_name.lower(), model_name)
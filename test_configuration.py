@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test script to verify the Zen MCP Server configuration for 3-model collaboration."""
 
+import functools
 import os
 import sys
 from pathlib import Path
@@ -20,6 +21,12 @@ os.environ["GEMINI_API_KEY"] = "test-key"
 os.environ["OPENAI_API_KEY"] = "test-key"
 os.environ["XAI_API_KEY"] = "test-key"
 
+@functools.cache
+def _provider(provider_cls):
+    """Construct each provider once and reuse it across checks."""
+    return provider_cls(api_key="test-key")
+
+
 def test_configuration():
     """Test the configuration settings."""
     print("=" * 60)
@@ -42,7 +49,7 @@ def test_configuration():
     
     try:
         from providers.openai_provider import OpenAIModelProvider
-        provider = OpenAIModelProvider(api_key="test-key")
+        provider = _provider(OpenAIModelProvider)
         print(f"   [OK] OpenAI Provider loaded")
         print(f"     - Models: {list(provider.SUPPORTED_MODELS.keys())}")
         print(f"     - gpt-5-latest available: {'gpt-5-latest' in provider.SUPPORTED_MODELS}")
@@ -51,7 +58,7 @@ def test_configuration():
     
     try:
         from providers.gemini import GeminiModelProvider
-        provider = GeminiModelProvider(api_key="test-key")
+        provider = _provider(GeminiModelProvider)
         print(f"   [OK] Gemini Provider loaded")
         models = list(provider.SUPPORTED_MODELS.keys())
         print(f"     - gemini-2.5-pro available: {'gemini-2.5-pro' in provider.SUPPORTED_MODELS}")
@@ -60,7 +67,7 @@ def test_configuration():
     
     try:
         from providers.xai import XAIModelProvider
-        provider = XAIModelProvider(api_key="test-key")
+        provider = _provider(XAIModelProvider)
         print(f"   [OK] X.AI Provider loaded")
         print(f"     - grok-4 available: {'grok-4' in provider.SUPPORTED_MODELS}")
     except Exception as e:
@@ -114,7 +121,7 @@ def test_configuration():
                 (GeminiModelProvider, "Gemini"),
                 (XAIModelProvider, "X.AI")
             ]:
-                provider = provider_cls(api_key="test-key")
+                provider = _provider(provider_cls)
                 preferred = provider.get_preferred_model(
                     category, 
                     list(provider.SUPPORTED_MODELS.keys())
@@ -98,6 +98,25 @@ class TestModelRestrictionService:
 
             assert filtered == ["o3-mini", "o4-mini"]
 
+    def test_is_allowed_batch(self):
+        """Test batch allowance checks match individual is_allowed results."""
+        with patch.dict(os.environ, {"OPENAI_ALLOWED_MODELS": "o3-mini,o4-mini"}):
+            service = ModelRestrictionService()
+
+            items = [
+                (ProviderType.OPENAI, "o3-mini", None),
+                (ProviderType.OPENAI, "o3", None),
+                (ProviderType.OPENAI, "o3", None),  # Duplicates are collapsed
+                (ProviderType.GOOGLE, "gemini-2.5-pro", None),
+            ]
+            results = service.is_allowed_batch(items)
+
+            assert results == {
+                (ProviderType.OPENAI, "o3-mini"): True,
+                (ProviderType.OPENAI, "o3"): False,
+                (ProviderType.GOOGLE, "gemini-2.5-pro"): True,
+            }
+
     def test_get_allowed_models(self):
         """Test getting the set of allowed models."""
         with patch.dict(os.environ, {"OPENAI_ALLOWED_MODELS": "o3-mini,o4-mini"}):
@@ -38,6 +38,20 @@ class TestOpenAIProvider:
         assert provider.api_key == "test-key"
         assert provider.base_url == "https://custom.openai.com/v1"
 
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=False)
+    def test_alias_index_covers_api_model_names(self):
+        """Test that the alias index subsumes lookups by API model name.
+
+        get_capabilities used to fall back to a linear scan comparing the
+        resolved name against capabilities.model_name; the precomputed index
+        must keep that path working for every entry.
+        """
+        provider = OpenAIModelProvider("test-key")
+
+        for key, capabilities in OpenAIModelProvider.SUPPORTED_MODELS.items():
+            assert OpenAIModelProvider._ALIAS_INDEX[capabilities.model_name.lower()] == key
+            assert provider.get_capabilities(capabilities.model_name) is capabilities
+
     def test_model_validation(self):
         """Test model name validation."""
         provider = OpenAIModelProvider("test-key")
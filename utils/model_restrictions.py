@@ -22,6 +22,7 @@ Example:
 
 import logging
 import os
+from collections.abc import Iterable
 from typing import Optional
 
 from providers.base import ProviderType
@@ -167,6 +168,31 @@ class ModelRestrictionService:
         # If any of the names is in the allowed set, it's allowed
         return any(name in allowed_set for name in names_to_check)
 
+    def is_allowed_batch(
+        self, items: Iterable[tuple[ProviderType, str, Optional[str]]]
+    ) -> dict[tuple[ProviderType, str], bool]:
+        """
+        Check a batch of models in a single pass over the restriction state.
+
+        Callers that need allowances for several models (e.g. filtering a
+        provider's full model list per request) should prefer this over
+        repeated is_allowed() calls so the service is dispatched once and
+        duplicate entries are only evaluated once.
+
+        Args:
+            items: Iterable of (provider_type, model_name, original_name)
+                tuples; original_name may be None
+
+        Returns:
+            Dict mapping (provider_type, model_name) to the allowed flag
+        """
+        results: dict[tuple[ProviderType, str], bool] = {}
+        for provider_type, model_name, original_name in items:
+            key = (provider_type, model_name)
+            if key not in results:
+                results[key] = self.is_allowed(provider_type, model_name, original_name)
+        return results
+
     def get_allowed_models(self, provider_type: ProviderType) -> Optional[set[str]]:
         """
         Get the set of allowed models for a provider.
@@ -205,7 +231,8 @@ class ModelRestrictionService:
         if not self.has_restrictions(provider_type):
             return models
 
-        return [m for m in models if self.is_allowed(provider_type, m)]
+        allowed_map = self.is_allowed_batch((provider_type, m, None) for m in models)
+        return [m for m in models if allowed_map[(provider_type, m)]]
 
     def get_restriction_summary(self) -> dict[str, any]:
         """